@@ -1,48 +1,27 @@
 from __future__ import annotations
-import importlib
-import pkgutil
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from fr_2ddoc_parser.crypto.key_resolver import local_key_resolver
 from fr_2ddoc_parser.model.models import Decoded2DDoc
 from fr_2ddoc_parser.parser.parser import parse
 from fr_2ddoc_parser.registry.registry import get_handler, TypeHandler
 from fr_2ddoc_parser.type.base import GenericDoc
-import fr_2ddoc_parser.type as _types_pkg
 
-_handlers_loaded = False
+logger = logging.getLogger(__name__)
 
 
-def _ensure_handlers_loaded():
-    """Charge dynamiquement tous les modules de fr_2ddoc.types pour
-    exécuter les décorateurs @register(...) et remplir le registre.
-
-    Évite d'avoir à faire des imports explicites des handlers dans __init__.
-    """
-    global _handlers_loaded
-    if _handlers_loaded:
-        return
-    for mod in pkgutil.iter_modules(_types_pkg.__path__):
-        importlib.import_module(f"{_types_pkg.__name__}.{mod.name}")
-    _handlers_loaded = True
-
-
-def decode_2d_doc(data: str) -> Decoded2DDoc:
-    """Decode un 2D-DOC DC04 depuis une chaîne lue (DataMatrix).
-
-    Retourne un objet Decoded2DDoc avec :
-      - header (DC04)
-      - fields (dict id->valeur)
-      - signature (bloc avec Base32 + bytes)
-      - typed (si un handler de type est enregistré)
-    """
+def _decode_unverified(data: str, typed: bool) -> Decoded2DDoc:
+    """Parsing DC04 + variante typée, sans vérification de signature."""
     parsed_data = parse(data)
-    _ensure_handlers_loaded()
-    tuple: Optional[tuple[TypeHandler, str]] = get_handler(parsed_data.header.doc_type)
-    detected_handler: Optional[TypeHandler] = None
-    handler_name: Optional[str] = None
-    if tuple is not None :
-        detected_handler, handler_name = tuple
-    if detected_handler:
+    if not typed:
+        return parsed_data
+    handler_info: Optional[Tuple[TypeHandler, str]] = get_handler(
+        parsed_data.header.doc_type
+    )
+    if handler_info is not None:
+        detected_handler, handler_name = handler_info
         parsed_data.typed = detected_handler(parsed_data)
         parsed_data.ants_type = handler_name
     else:
@@ -52,9 +31,70 @@ def decode_2d_doc(data: str) -> Decoded2DDoc:
             country=parsed_data.header.country,
             fields=parsed_data.fields,
         )
-    try:
-        parsed_data.verify(key_resolver=local_key_resolver)
-    except Exception as e:
-        print(f"Warning: signature verification failed: {e}")
-        pass
     return parsed_data
+
+
+def decode_2d_doc(
+    data: str, *, verify: bool = True, typed: bool = True
+) -> Decoded2DDoc:
+    """Decode un 2D-DOC DC04 depuis une chaîne lue (DataMatrix).
+
+    Retourne un objet Decoded2DDoc avec :
+      - header (DC04)
+      - fields (dict id->valeur)
+      - signature (bloc avec Base32 + bytes)
+      - typed (si un handler de type est enregistré)
+
+    verify=False saute la vérification ECDSA (is_valid reste False), pour les
+    lots dont la provenance est déjà garantie.
+    typed=False ne construit pas la variante typée (typed reste None) quand
+    seuls les champs bruts sont utiles.
+    """
+    parsed_data = _decode_unverified(data, typed)
+    if verify:
+        try:
+            parsed_data.verify(key_resolver=local_key_resolver)
+        except Exception as e:
+            logger.warning("signature verification failed: %s", e)
+    return parsed_data
+
+
+def decode_2d_doc_batch(
+    data_list: Iterable[str],
+    *,
+    verify: bool = True,
+    typed: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[Decoded2DDoc]:
+    """Décode un lot de 2D-DOC (même résultat que decode_2d_doc, dans l'ordre).
+
+    Le parsing et la variante typée sont faits dans le thread appelant. Les
+    signatures sont regroupées par émetteur (ca_id, cert_id) : la clé publique
+    n'est résolue qu'une fois par groupe, puis les vérifications ECDSA (qui
+    relâchent le GIL dans OpenSSL) sont réparties sur un pool de max_workers
+    threads.
+    """
+    docs = [_decode_unverified(data, typed) for data in data_list]
+    if not verify:
+        return docs
+
+    groups: Dict[Tuple[str, str], List[Decoded2DDoc]] = {}
+    for doc in docs:
+        groups.setdefault((doc.header.ca_id, doc.header.cert_id), []).append(doc)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for (ca_id, cert_id), group in groups.items():
+            try:
+                pub = local_key_resolver.resolve(ca_id, cert_id)
+            except Exception as e:
+                for _ in group:
+                    logger.warning("signature verification failed: %s", e)
+                continue
+            futures.extend(pool.submit(doc.verify_with_key, pub) for doc in group)
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("signature verification failed: %s", e)
+    return docs
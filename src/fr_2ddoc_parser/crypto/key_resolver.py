@@ -12,6 +12,7 @@ import hashlib
 
 import urllib.request
 import urllib.parse
+from functools import lru_cache
 from html import unescape
 
 from importlib.resources import files
@@ -278,6 +279,9 @@ class KeyResolver:
         self._per_ca = per_ca
         self._leaf_index = leaf_index or {}  # feuilles { (CA, cert_id) -> cert }
         self._per_ca_leaf = per_ca_leaf or {}  # feuilles par CA
+        # Clés publiques déjà résolues : évite de re-parser le SPKI à chaque
+        # signature d'un même émetteur (les KeyError ne sont pas mises en cache)
+        self._resolve_cached = lru_cache(maxsize=64)(self._resolve)
 
     @classmethod
     def from_tsl(
@@ -358,6 +362,9 @@ class KeyResolver:
 
     def resolve(self, ca_id: str, cert_id: str):
         """Retourne la *clé publique* pour (CA, cert_id), en préférant une feuille EC si dispo."""
+        return self._resolve_cached(ca_id, cert_id)
+
+    def _resolve(self, ca_id: str, cert_id: str):
         key = self._leaf_index.get((ca_id.upper(), (cert_id or "").upper()))
         if key is not None:
             return key.public_key()
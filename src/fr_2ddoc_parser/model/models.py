@@ -6,13 +6,12 @@ from typing import Dict, Optional, Any
 
 from fr_2ddoc_parser.crypto.crypto import verify_signature
 from fr_2ddoc_parser.crypto.key_resolver import KeyResolver
-from pydantic import BaseModel
 
 GS = "\x1d"  # Group Separator (sépare les paires champ/valeur)
 US = "\x1f"  # Unit Separator (sépare les données de la signature)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Header:
     raw: str
     marker: str
@@ -27,7 +26,7 @@ class Header:
     header_len: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignatureBlock:
     present: bool
     b32: Optional[str] = None
@@ -35,7 +34,7 @@ class SignatureBlock:
     alg_hint: Optional[str] = None  # "P-256"/"P-384"/"P-521" if detectable
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Decoded2DDoc:
     header: Header
     # Données brutes "avant US" (sert au hash/verify)
@@ -43,14 +42,23 @@ class Decoded2DDoc:
     # Paires ID -> valeur (après parsing des segments GS)
     fields: Dict[str, str] = field(default_factory=dict)
     # Variante typée (si un modèle dédié existe pour ce type)
-    typed: Optional[BaseModel] = None
+    typed: Optional[Any] = None
     signature: SignatureBlock = field(default_factory=lambda: SignatureBlock(False))
     is_valid: bool = False
     ants_type: Optional[str] = None
 
     def verify(self, key_resolver: "KeyResolver"):
         """Vérifie la signature si présente via un résolveur de clé (AC+cert)."""
-        if not self.signature.present or not self.signature.raw:
+        sig = self.signature
+        if not sig.present or not sig.raw:
             raise ValueError("Pas de signature présente dans ce 2D-DOC.")
-        pub = key_resolver.resolve(self.header.ca_id, self.header.cert_id)
-        self.is_valid = verify_signature(self.sign_payload, self.signature.raw, pub)
+        hdr = self.header
+        pub = key_resolver.resolve(hdr.ca_id, hdr.cert_id)
+        self.is_valid = verify_signature(self.sign_payload, sig.raw, pub)
+
+    def verify_with_key(self, public_key: Any):
+        """Vérifie la signature avec une clé publique déjà résolue."""
+        sig = self.signature
+        if not sig.present or not sig.raw:
+            raise ValueError("Pas de signature présente dans ce 2D-DOC.")
+        self.is_valid = verify_signature(self.sign_payload, sig.raw, public_key)
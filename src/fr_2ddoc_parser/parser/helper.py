@@ -1,8 +1,10 @@
 # -----------------------------
 # Helpers de conversion
-from datetime import date, datetime
+import sys
+from datetime import date
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import AbstractSet, Dict, Optional
 
 
 def to_int(s: Optional[str]) -> Optional[int]:
@@ -27,7 +29,32 @@ def to_dec(s: Optional[str]) -> Optional[Decimal]:
 def to_date_ddmmyyyy(s: Optional[str]) -> Optional[date]:
     if not s:
         return None
+    return _parse_ddmmyyyy(s)
+
+
+# Les dates d'un lot de documents se répètent beaucoup (émission, validité)
+@lru_cache(maxsize=1024)
+def _parse_ddmmyyyy(s: str) -> Optional[date]:
+    # Largeur fixe : découpage direct, bien plus rapide que strptime
+    if len(s) != 8 or not (s.isascii() and s.isdigit()):
+        return None
     try:
-        return datetime.strptime(s, "%d%m%Y").date()
+        return date(int(s[4:8]), int(s[2:4]), int(s[0:2]))
     except ValueError:
         return None
+
+
+def to_interned(s: Optional[str]) -> str:
+    """Strip + sys.intern, réservé aux champs à faible cardinalité
+    (codes pays, genre, type de pièce) ; ne pas utiliser pour noms ou IDs."""
+    if not s:
+        return ""
+    return sys.intern(s.strip())
+
+
+def extract_extras(fields: Dict[str, str], known: AbstractSet[str]) -> Dict[str, str]:
+    """Champs non cartographiés de `fields` (ordre d'origine conservé)."""
+    # Cas courant : tous les IDs sont connus -> test d'inclusion fait en C
+    if fields.keys() <= known:
+        return {}
+    return {k: v for k, v in fields.items() if k not in known}
@@ -21,6 +21,9 @@ SPEC_INDEX: dict[str, tuple[int, int]] = {
 }
 ID_RE = re.compile(r"^[0-9A-Z]{2}$")
 
+# Taille de la signature (r||s) -> courbe ECDSA
+_ALG_HINTS: dict[int, str] = {64: "P-256", 96: "P-384", 132: "P-521"}
+
 
 # ---------------------------------------------------------------------------
 # Normalisation des séparateurs (si la chaîne contient <GS>/<RS>/<US>, ␝/␞/␟
@@ -216,13 +219,9 @@ def parse(data: str) -> Decoded2DDoc:
             sig_raw = base64.b32decode(_b32_fixpad(sig_b32), casefold=True)
         except Exception as e:
             raise TwoDDocFormatError(f"Signature Base32 invalide: {e}")
-        sig_block = SignatureBlock(True, b32=sig_b32, raw=sig_raw)
-        if len(sig_raw) == 64:
-            sig_block.alg_hint = "P-256"
-        elif len(sig_raw) == 96:
-            sig_block.alg_hint = "P-384"
-        elif len(sig_raw) == 132:
-            sig_block.alg_hint = "P-521"
+        sig_block = SignatureBlock(
+            True, b32=sig_b32, raw=sig_raw, alg_hint=_ALG_HINTS.get(len(sig_raw))
+        )
 
     return Decoded2DDoc(
         header=header,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Tuple
 
 from fr_2ddoc_parser.model.models import Decoded2DDoc
 
@@ -18,17 +19,31 @@ class TypeInfo:
 
 class TypeRegistry:
     def __init__(self):
-        self._handlers: Dict[str, tuple[TypeHandler, name]] = {}
+        self._handlers: Dict[str, Tuple[TypeHandler, str]] = {}
 
     def register(self, code: str, handler: TypeHandler, name: str):
-        self._handlers[code.upper()] = [handler, name]
+        self._handlers[code.upper()] = (handler, name)
 
-    def get(self, code: str) -> Optional[tuple[TypeHandler, name: str]]:
-        return self._handlers.get(code.upper())
+    def get(self, code: str) -> Optional[Tuple[TypeHandler, str]]:
+        # Chemin rapide : le doc_type issu du parsing est déjà en majuscules
+        found = self._handlers.get(code)
+        if found is None:
+            found = self._handlers.get(code.upper())
+        return found
 
 
 # Registre global simple
 _registry = TypeRegistry()
+# Lecture directe du dict : register() le modifie en place, le lien reste valide
+_lookup = _registry._handlers.get
+
+# Module déclarant le handler de chaque doc_type (via @register). Le module
+# n'est importé qu'à la première rencontre du code : pas de scan du package
+# ni d'import des types jamais décodés.
+_DEFERRED: Dict[str, str] = {
+    "07": "fr_2ddoc_parser.type.doc07_carte_identite",
+    "28": "fr_2ddoc_parser.type.doc28_avis_impots",
+}
 
 
 def register(code: str, name: str):
@@ -39,5 +54,13 @@ def register(code: str, name: str):
     return deco
 
 
-def get_handler(code: str) -> Optional[tuple[TypeHandler, str]]:
-    return _registry.get(code)
+def get_handler(code: str) -> Optional[Tuple[TypeHandler, str]]:
+    found = _lookup(code)
+    if found is None:
+        found = _registry.get(code)
+    if found is None:
+        module_name = _DEFERRED.get(code.upper())
+        if module_name is not None:
+            importlib.import_module(module_name)
+            found = _registry.get(code)
+    return found
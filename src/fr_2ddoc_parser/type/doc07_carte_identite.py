@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, Literal, Optional
+from typing import Dict, Optional
 
 from fr_2ddoc_parser.model.models import Decoded2DDoc
-from fr_2ddoc_parser.parser.helper import to_date_ddmmyyyy
+from fr_2ddoc_parser.parser.helper import (
+    extract_extras,
+    to_date_ddmmyyyy,
+    to_interned,
+)
 from fr_2ddoc_parser.registry.registry import register
-from pydantic import BaseModel, Field
+
+# IDs de champs cartographiés (les autres vont dans `extras`)
+_KNOWN_07 = frozenset(
+    (
+        "60", "61", "62", "63", "65", "66", "67", "68",
+        "69", "6A", "6C", "6F", "6N", "6O",
+        "6S", "6T", "6U", "6V", "6W", "6X", "6Y",
+    )
+)
 
 
 # -----------------------------
 # Adresse — Spécifique Titres Identité (07)
-class AdresseIdentite(BaseModel):
+@dataclass(slots=True)
+class AdresseIdentite:
     """Adresse pour Titres d'Identité (doc 07).
     Basé sur le tableau des spécifications.
     Champs disponibles :
@@ -34,15 +48,16 @@ class AdresseIdentite(BaseModel):
 
 # -----------------------------
 # Carte Nationale d'Identité (doc 07)
-class CarteIdentite(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CarteIdentite:
     """Modèle typé pour Carte Nationale d'Identité (07)."""
 
-    doc_type: Literal["07"]
+    doc_type: str
 
     # Données Personnelles
     liste_prenoms: str  # 60
     prenom: Optional[str] = None  # 61
-    nom_patronymique: str = None  # 62
+    nom_patronymique: Optional[str] = None  # 62
     nom_usage: Optional[str] = None  # 63
     type_piece_identite: str # 65
     numero_document: str # 66
@@ -57,10 +72,10 @@ class CarteIdentite(BaseModel):
     date_debut_validite: Optional[date] = None  # 6N
     date_fin_validite: Optional[date] = None  # 6O
 
-    adresse: AdresseIdentite = Field(default_factory=AdresseIdentite)
+    adresse: AdresseIdentite = field(default_factory=AdresseIdentite)
 
     # Champs supplémentaires non cartographiés
-    extras: Dict[str, str] = Field(default_factory=dict)
+    extras: Dict[str, str] = field(default_factory=dict)
 
     # -------------------------
     # Construction depuis Decoded2DDoc
@@ -77,27 +92,21 @@ class CarteIdentite(BaseModel):
             pays=f.get("6Y"),
         )
 
-        known = {
-            "60", "61", "62", "63", "65", "66", "67", "68",
-            "69", "6A", "6C", "6F", "6N", "6O",
-            "6S", "6T", "6U", "6V", "6W", "6X", "6Y"
-        }
-
-        extras = {k: v for k, v in f.items() if k not in known}
+        extras = extract_extras(f, _KNOWN_07)
 
-        obj = cls(
+        return cls(
             doc_type=d.header.doc_type,
             liste_prenoms=f.get("60", "").strip(),
             prenom=f.get("61"),
             nom_patronymique=f.get("62"),
             nom_usage=f.get("63"),
-            type_piece_identite=f.get("65", "").strip(),
+            type_piece_identite=to_interned(f.get("65")),
             numero_document=f.get("66", "").strip(),
-            nationalite=f.get("67", "").strip(),
-            genre=f.get("68", "").strip(),
+            nationalite=to_interned(f.get("67")),
+            genre=to_interned(f.get("68")),
             date_naissance=to_date_ddmmyyyy(f.get("69")),
             lieu_naissance=f.get("6A"),
-            pays_naissance=f.get("6C"),
+            pays_naissance=to_interned(f.get("6C")),
             mrz=f.get("6F"),
             date_debut_validite=to_date_ddmmyyyy(f.get("6N")),
             date_fin_validite=to_date_ddmmyyyy(f.get("6O")),
@@ -105,12 +114,9 @@ class CarteIdentite(BaseModel):
             extras=extras,
         )
 
-        obj.validate()
-        return obj
-
     # -------------------------
-    # Validation des règles O / F
-    def validate(self) -> None:
+    # Validation des règles O / F (exécutée à la construction)
+    def __post_init__(self) -> None:
         # 1. Validation Prénoms (60) - O
         if not self.liste_prenoms:
             raise ValueError("La liste des prénoms (60) est obligatoire.")
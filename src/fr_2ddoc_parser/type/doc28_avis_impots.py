@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from typing import Dict, Literal, Optional
-
-from pydantic import BaseModel, Field
+from typing import Dict, Optional
 
 from fr_2ddoc_parser.model.models import Decoded2DDoc
-from fr_2ddoc_parser.parser.helper import to_date_ddmmyyyy, to_dec, to_int
+from fr_2ddoc_parser.parser.helper import (
+    extract_extras,
+    to_date_ddmmyyyy,
+    to_dec,
+    to_int,
+)
 from fr_2ddoc_parser.registry.registry import register
 
+# IDs de champs cartographiés (les autres vont dans `extras`)
+_KNOWN_28 = frozenset(
+    (
+        "41",
+        "43",
+        "44",
+        "45",
+        "46",
+        "47",
+        "48",
+        "49",
+        "4A",
+        "4V",
+        "4W",
+        "4X",
+        "4Y",
+        "6U",
+        "6V",
+        "6W",
+        "6X",
+        "6Y",
+    )
+)
+
 
 # -----------------------------
 # Adresse — règle O(1)/O(2)
-class AdresseImposition(BaseModel):
+@dataclass(slots=True)
+class AdresseImposition:
     """Adresse pour avis d'imposition (docs 28).
     O(1)  : 4Y (adresse complète) obligatoire si on ne peut pas suivre la norme postale.
     O(2)  : 6U/6W/6X/6Y obligatoires si on suit la norme postale (4Y devient alors facultatif).
@@ -28,16 +57,19 @@ class AdresseImposition(BaseModel):
     pays: Optional[str] = None  # 6Y
 
     def is_ok_28(self) -> bool:
-        struct_ok = bool(self.voie and self.code_postal and self.commune and self.pays)
-        return bool(self.full) or struct_ok
+        # 4Y (cas courant) court-circuite la vérification de l'adresse structurée
+        return bool(
+            self.full or (self.voie and self.code_postal and self.commune and self.pays)
+        )
 
 
 # -----------------------------
 # Avis d'imposition (doc 28)
-class AvisImposition(BaseModel):
+@dataclass(slots=True)
+class AvisImposition:
     """Modèle typé pour Avis d'impôt (28)."""
 
-    doc_type: Literal["28"]
+    doc_type: str
     nombre_de_parts: Decimal  # 43
     reference_avis: str  # 44
     annee_des_revenus: int  # 45
@@ -51,10 +83,10 @@ class AvisImposition(BaseModel):
     reste_a_payer: Optional[int] = None  # 4W (F)
     retenue_a_la_source: Optional[int] = None  # 4X (F)
 
-    adresse: AdresseImposition = Field(default_factory=AdresseImposition)
+    adresse: AdresseImposition = field(default_factory=AdresseImposition)
 
     # Champs supplémentaires non cartographiés
-    extras: Dict[str, str] = Field(default_factory=dict)
+    extras: Dict[str, str] = field(default_factory=dict)
 
     # -------------------------
     # Construction depuis Decoded2DDoc
@@ -69,30 +101,9 @@ class AvisImposition(BaseModel):
             commune=f.get("6X"),
             pays=f.get("6Y"),
         )
-        known = {
-            "41",
-            "43",
-            "44",
-            "45",
-            "46",
-            "47",
-            "48",
-            "49",
-            "4A",
-            "4V",
-            "4W",
-            "4X",
-            "4Y",
-            "6U",
-            "6V",
-            "6W",
-            "6X",
-            "6Y",
-        }
-
-        extras = {k: v for k, v in f.items() if k not in known}
-
-        obj = cls(
+        extras = extract_extras(f, _KNOWN_28)
+
+        return cls(
             doc_type=d.header.doc_type,
             revenu_fiscal_de_reference=to_int(f.get("41")),
             nombre_de_parts=to_dec(f.get("43")),
@@ -109,14 +120,10 @@ class AvisImposition(BaseModel):
             adresse=adresse,
             extras=extras,
         )
-        # Ne pas utiliser la validation Pydantic pour les règles métier :
-        # on conserve le comportement existant en appelant validate() explicitement.
-        obj.validate()
-        return obj
 
     # -------------------------
-    # Validation des règles O / F + O(1)/O(2)
-    def validate(self) -> None:
+    # Validation des règles O / F + O(1)/O(2) (exécutée à la construction)
+    def __post_init__(self) -> None:
         # Obligatoires
         if not self.nombre_de_parts:
             raise ValueError("Nombre de parts (43) est obligatoire.")
@@ -2,11 +2,17 @@
 Tests unitaires pour le décodage des 2D-DOC de type avis d'impôts (type 28).
 """
 
+import base64
 import pytest
 from datetime import date
 from decimal import Decimal
 
-from fr_2ddoc_parser.api import decode_2d_doc
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+import fr_2ddoc_parser.api as api
+from fr_2ddoc_parser.api import decode_2d_doc, decode_2d_doc_batch
 from fr_2ddoc_parser.type.doc28_avis_impots import AvisImposition, AdresseImposition
 from fr_2ddoc_parser.exception.exceptions import TwoDDocFormatError
 
@@ -111,6 +117,52 @@ class TestAvisImpots:
         # Si on arrive ici sans exception, c'est que c'est ok
         assert avis.adresse.is_ok_28() is True
 
+    def test_skip_verification(self, sample_2d_doc):
+        """Test que verify=False décode sans vérifier la signature."""
+        result = decode_2d_doc(sample_2d_doc, verify=False)
+
+        assert isinstance(result.typed, AvisImposition)
+        assert result.signature.present is True
+        assert result.is_valid is False
+
+    def test_skip_typed(self, sample_2d_doc):
+        """Test que typed=False ne construit pas la variante typée."""
+        result = decode_2d_doc(sample_2d_doc, typed=False)
+
+        assert result.typed is None
+        assert result.ants_type is None
+        assert "44" in result.fields
+
+    def test_decode_batch(self, sample_2d_doc):
+        """Test que le décodage par lot équivaut au décodage unitaire."""
+        single = decode_2d_doc(sample_2d_doc)
+        results = decode_2d_doc_batch([sample_2d_doc, sample_2d_doc], max_workers=2)
+
+        assert len(results) == 2
+        for result in results:
+            assert result.fields == single.fields
+            assert result.typed == single.typed
+            assert result.is_valid == single.is_valid
+
+    def test_decode_batch_verifies_signatures(self, monkeypatch):
+        """Test que les signatures d'un lot sont vérifiées (clé locale P-256)."""
+        key = ec.generate_private_key(ec.SECP256R1())
+        payload = "DC04FR000001FFFF23DC2801FR432,75<GS>44227801234567845202146RETI PATRICK<GS>4A310720224Y145 RUE JULLIARD/ZASPECIMEN/78320/LEVIS STNOM<GS>"
+        signed = payload.replace("<GS>", "\x1d").encode()
+        r, s = decode_dss_signature(key.sign(signed, ec.ECDSA(hashes.SHA256())))
+        sig = base64.b32encode(r.to_bytes(32, "big") + s.to_bytes(32, "big"))
+        good = f"{payload}<US>{sig.decode().rstrip('=')}"
+        bad = good.replace("RETI PATRICK", "RETI PATRICE")
+
+        class _Resolver:
+            def resolve(self, ca_id, cert_id):
+                return key.public_key()
+
+        monkeypatch.setattr(api, "local_key_resolver", _Resolver())
+        results = decode_2d_doc_batch([good, bad, good], max_workers=2)
+
+        assert [result.is_valid for result in results] == [True, False, True]
+
     def test_invalid_format_raises_error(self):
         """Test qu'un format invalide lève une erreur."""
         with pytest.raises(TwoDDocFormatError):
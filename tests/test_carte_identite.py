@@ -0,0 +1,59 @@
+"""
+Tests unitaires pour le décodage des 2D-DOC de type carte d'identité (type 07).
+"""
+
+import pytest
+
+from fr_2ddoc_parser.api import decode_2d_doc
+from fr_2ddoc_parser.type.doc07_carte_identite import AdresseIdentite, CarteIdentite
+
+HEADER = "DC04FR000001FFFF23DC0701FR"
+FIELDS = {
+    "60": "JEAN PIERRE",
+    "62": "DUPONT",
+    "65": "P",
+    "66": "X4RTBPFW4",
+    "67": "FR",
+    "68": "M",
+    "69": "15031990",
+    "6U": "ZASPECIMEN",
+    "6W": "78320",
+}
+
+
+def _build(fields):
+    """Construit un 2D-DOC 07 (non signé) à partir des paires ID -> valeur."""
+    return HEADER + "".join(f"{k}{v}<GS>" for k, v in fields.items())
+
+
+class TestCarteIdentite:
+    """Tests pour les cartes d'identité (document type 07)."""
+
+    def test_typed_data_is_carte_identite(self):
+        """Test que les données typées sont bien une CarteIdentite."""
+        result = decode_2d_doc(_build(FIELDS), verify=False)
+        carte = result.typed
+
+        assert isinstance(carte, CarteIdentite)
+        assert result.ants_type == "carte_identite"
+        assert carte.liste_prenoms == "JEAN PIERRE"
+        assert carte.nationalite == "FR"
+        assert carte.genre == "M"
+        assert isinstance(carte.adresse, AdresseIdentite)
+        assert carte.adresse.code_postal == "78320"
+        assert carte.extras == {}
+
+    @pytest.mark.parametrize(
+        "field_id, message",
+        [
+            ("60", "prénoms \\(60\\)"),
+            ("67", "nationalité \\(67\\)"),
+            ("68", "genre \\(68\\)"),
+        ],
+    )
+    def test_missing_mandatory_field_raises(self, field_id, message):
+        """Test qu'un champ obligatoire absent lève une ValueError."""
+        fields = {k: v for k, v in FIELDS.items() if k != field_id}
+
+        with pytest.raises(ValueError, match=message):
+            decode_2d_doc(_build(fields), verify=False)
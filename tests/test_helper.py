@@ -0,0 +1,31 @@
+"""
+Tests unitaires pour les helpers de conversion (parser.helper).
+"""
+
+from datetime import date
+
+from fr_2ddoc_parser.parser.helper import to_date_ddmmyyyy
+
+
+class TestToDateDdmmyyyy:
+    """Tests pour la conversion des dates DDMMYYYY."""
+
+    def test_valid_date(self):
+        """Test qu'une date DDMMYYYY valide est convertie."""
+        assert to_date_ddmmyyyy("31072022") == date(2022, 7, 31)
+
+    def test_empty_returns_none(self):
+        """Test qu'une valeur absente donne None."""
+        assert to_date_ddmmyyyy(None) is None
+        assert to_date_ddmmyyyy("") is None
+
+    def test_invalid_calendar_date_returns_none(self):
+        """Test qu'une date impossible donne None."""
+        assert to_date_ddmmyyyy("31022022") is None
+
+    def test_malformed_returns_none(self):
+        """Test qu'une chaîne mal formée donne None."""
+        assert to_date_ddmmyyyy("3107202") is None
+        assert to_date_ddmmyyyy("310720221") is None
+        assert to_date_ddmmyyyy("31-07-22") is None
+        assert to_date_ddmmyyyy("+1072022") is None